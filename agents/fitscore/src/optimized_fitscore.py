@@ -2,22 +2,25 @@ import re
 import json
 import time
 import asyncio
+import threading
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple, Any
-from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-import hashlib
+from dataclasses import dataclass, replace
 from functools import lru_cache
 import logging
 import os
-from openai import OpenAI
+import sys
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
-load_dotenv()
-
 # Setup logger
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keyword hits bucketed per category, one list of matched text per tier (in tier order)
+SignalHits = Dict[str, List[List[str]]]
+
+@dataclass(slots=True)
 class EliteScore:
     overall: float
     education: float
@@ -46,7 +49,12 @@ class EliteScore:
         }
 
 class EliteTalentDetector:
-    """Ultra-fast elite talent detection system using pattern matching"""
+    """Ultra-fast elite talent detection system using pattern matching
+    
+    Patterns are matched case-sensitively against lowercased text, so every
+    detect_* method expects the candidate text to be lowercased once by the
+    caller (see OptimizedFitScore.evaluate_candidate_fast).
+    """
     
     # Elite tier classifications with scoring
     ELITE_UNIVERSITIES = {
@@ -165,62 +173,178 @@ class EliteTalentDetector:
         }
     }
     
+    # Achievement instances that count towards a tier's score; later hits are not collected
+    ACHIEVEMENT_INSTANCE_CAP = 3
+    
+    # Skill levels in bucket order for the "skills" category of a scan
+    SKILL_LEVELS = ("core", "advanced", "leadership")
+    
+    # Per-tier scores as flat tuples in tier order, indexed like the scanner's hit buckets
+    EDU_SCORES = tuple(data["score"] for data in ELITE_UNIVERSITIES.values())
+    COMPANY_SCORES = tuple(data["score"] for data in ELITE_COMPANIES.values())
+    LEADERSHIP_SCORES = tuple(data["score"] * data["weight"] for data in LEADERSHIP_SIGNALS.values())
+    ACHIEVEMENT_SCORES = tuple(data["score"] * data["weight"] for data in ACHIEVEMENT_SIGNALS.values())
+    
     def __init__(self):
         self._compile_patterns()
     
-    def _compile_patterns(self):
-        """Pre-compile regex patterns for performance"""
-        self.compiled_patterns = {}
+    @classmethod
+    def _compile_patterns(cls):
+        """Pre-compile a single signal scanner covering every keyword category
         
-        # Compile university patterns
-        for tier, data in self.ELITE_UNIVERSITIES.items():
-            self.compiled_patterns[f"edu_{tier}"] = re.compile(data["pattern"], re.IGNORECASE)
+        Compiled state lives on the class, so it is built once and shared by every instance.
+        """
+        if "compiled_patterns" in cls.__dict__:
+            return
+        
+        cls.signal_categories = {
+            "edu": cls.ELITE_UNIVERSITIES,
+            "company": cls.ELITE_COMPANIES,
+            "leadership": cls.LEADERSHIP_SIGNALS,
+            "achievement": cls.ACHIEVEMENT_SIGNALS
+        }
+        
+        # Slot per (category, tier) so one pass can bucket every hit by tier index,
+        # along with how many hits that bucket needs to keep
+        bucket_caps = {"achievement": cls.ACHIEVEMENT_INSTANCE_CAP}
+        cls.signal_groups = {
+            f"{category}_{tier}": (category, index, bucket_caps.get(category, sys.maxsize))
+            for category, signals in cls.signal_categories.items()
+            for index, tier in enumerate(signals)
+        }
+        cls.signal_groups.update({
+            f"skill_{level}": ("skills", index, sys.maxsize) for index, level in enumerate(cls.SKILL_LEVELS)
+        })
+        
+        signal_patterns = {
+            f"{category}_{tier}": data["pattern"]
+            for category, signals in cls.signal_categories.items()
+            for tier, data in signals.items()
+        }
+        cls.compiled_patterns = {
+            "signals": cls._compile_union(signal_patterns),
+            # Fallback probes for generic education/experience signals
+            "degree": re.compile(r"\b(degree|bachelor|master|phd|bs|ms|mba)\b"),
+            "years": re.compile(r"(\d+)\+?\s*years?\s+(of\s+)?experience"),
+            "role": re.compile(r"\b(engineer|developer|manager|analyst|consultant)\b")
+        }
         
-        # Compile company patterns
-        for tier, data in self.ELITE_COMPANIES.items():
-            self.compiled_patterns[f"company_{tier}"] = re.compile(data["pattern"], re.IGNORECASE)
+        # One fused scanner per role covering every signal tier plus that role's skills.
+        # Entries match independently, so skills count exactly as a separate skills scan
+        # would: "Scale AI" is a company and its "AI" still a skill, and "ML platform"
+        # still counts the core "ML"
+        cls.role_scanners = {
+            role: cls._compile_union({
+                **signal_patterns,
+                **{f"skill_{level}": skills[level] for level in cls.SKILL_LEVELS}
+            })
+            for role, skills in cls.TECHNICAL_SKILLS.items()
+        }
         
-        # Compile leadership patterns
-        for level, data in self.LEADERSHIP_SIGNALS.items():
-            self.compiled_patterns[f"leadership_{level}"] = re.compile(data["pattern"], re.IGNORECASE)
+        # Canonical spelling for each literal keyword, to report matches in display case
+        cls.display_names = cls._build_display_names(
+            [data["pattern"] for signals in cls.signal_categories.values() for data in signals.values()] +
+            [pattern for skills in cls.TECHNICAL_SKILLS.values() for pattern in skills.values()]
+        )
         
-        # Compile achievement patterns
-        for level, data in self.ACHIEVEMENT_SIGNALS.items():
-            self.compiled_patterns[f"achievement_{level}"] = re.compile(data["pattern"], re.IGNORECASE)
+        cls.tier_scores = {
+            "edu": cls.EDU_SCORES,
+            "company": cls.COMPANY_SCORES,
+            "leadership": cls.LEADERSHIP_SCORES,
+            "achievement": cls.ACHIEVEMENT_SCORES
+        }
     
-    def detect_education_signals(self, text: str) -> Tuple[float, List[str]]:
-        """Fast education tier detection"""
-        max_score = 0.0
-        detected_schools = []
+    @classmethod
+    def _compile_union(cls, patterns: Dict[str, str]) -> Tuple[re.Pattern, Tuple[Tuple[str, int, int], ...]]:
+        """Fuse several alternations into one scanner that still matches each of them independently
+        
+        Returns the scanner plus, for each of its capture groups, the signal_groups slot
+        the group's hits belong to. The scanner stops wherever some keyword starts and
+        tries every entry there in its own lookahead, so a hit in one tier never hides an
+        overlapping hit in another ("university of washington" still counts "washington").
+        The lookaheads rule out linear-time engines such as re2, which do not support them.
+        """
+        # Each pattern is wrapped as \b(...)\b - strip it and re-apply the boundaries per entry
+        alternations = [pattern[3:-3].lower() for pattern in patterns.values()]
+        entries = "".join(f"(?:(?=({alternation})\\b)|)" for alternation in alternations)
+        scanner = re.compile(rf"\b(?=(?:{'|'.join(alternations)})\b){entries}")
+        return scanner, tuple(cls.signal_groups[name] for name in patterns)
+    
+    @staticmethod
+    def _build_display_names(patterns: List[str]) -> Dict[str, str]:
+        """Map each lowercased literal alternative to the spelling used in the pattern"""
+        display_names = {}
+        for pattern in patterns:
+            for alternative in pattern[3:-3].split("|"):
+                literal = re.sub(r"\\(\W)", r"\1", alternative)
+                # Skip alternatives that are real regex (e.g. "increased \d+%")
+                if re.fullmatch(alternative, literal):
+                    display_names[literal.lower()] = literal
+        return display_names
+    
+    def scan_signals(self, text: str, role: Optional[str] = None) -> SignalHits:
+        """Single pass over the text, bucketing every keyword hit by category and tier
         
-        for tier, data in self.ELITE_UNIVERSITIES.items():
-            pattern = self.compiled_patterns[f"edu_{tier}"]
-            matches = pattern.findall(text)
-            if matches:
-                max_score = max(max_score, data["score"])
-                detected_schools.extend(matches)
+        When a role is given, that role's skills are collected in the same pass
+        under the "skills" category, one bucket per entry of SKILL_LEVELS.
+        """
+        hits = {
+            category: [[] for _ in signals]
+            for category, signals in self.signal_categories.items()
+        }
+        hits["skills"] = [[] for _ in self.SKILL_LEVELS]
+        
+        if role is None:
+            scanner = self.compiled_patterns["signals"]
+        else:
+            scanner = self.role_scanners.get(role, self.role_scanners["software_engineer"])
+        
+        scanner, slots = scanner
+        # Where each entry's last hit ended: like findall on that tier alone, hits of
+        # one entry never overlap each other
+        ends = [0] * len(slots)
+        for match in scanner.finditer(text):
+            start = match.start()
+            for entry, name in enumerate(match.groups()):
+                if name is None or start < ends[entry]:
+                    continue
+                ends[entry] = start + len(name)
+                category, index, cap = slots[entry]
+                bucket = hits[category][index]
+                # Skip materialising hits beyond what scoring consumes
+                if len(bucket) < cap:
+                    bucket.append(self.display_names.get(name, name))
+        
+        return hits
+    
+    def _max_tier_signal(self, category: str, tier_matches: List[List[str]]) -> Tuple[float, List[str]]:
+        """Best tier score among matched tiers, plus matches in tier order"""
+        max_score = max((score for score, matches in zip(self.tier_scores[category], tier_matches) if matches), default=0.0)
+        # Report matches in tier order, strongest signals first
+        detected = [name for matches in tier_matches for name in matches]
+        return max_score, detected
+    
+    def detect_education_signals(self, text: str, signals: Optional[SignalHits] = None) -> Tuple[float, List[str]]:
+        """Fast education tier detection"""
+        if signals is None:
+            signals = self.scan_signals(text)
+        max_score, detected_schools = self._max_tier_signal("edu", signals["edu"])
         
         # Default score for any degree
-        if not detected_schools and re.search(r"\b(degree|bachelor|master|phd|bs|ms|mba)\b", text, re.IGNORECASE):
+        if not detected_schools and self.compiled_patterns["degree"].search(text):
             max_score = 5.0
             detected_schools = ["General degree"]
         
         return max_score, detected_schools
     
-    def detect_experience_signals(self, text: str) -> Tuple[float, List[str]]:
+    def detect_experience_signals(self, text: str, signals: Optional[SignalHits] = None) -> Tuple[float, List[str]]:
         """Fast company tier detection"""
-        max_score = 0.0
-        detected_companies = []
-        
-        for tier, data in self.ELITE_COMPANIES.items():
-            pattern = self.compiled_patterns[f"company_{tier}"]
-            matches = pattern.findall(text)
-            if matches:
-                max_score = max(max_score, data["score"])
-                detected_companies.extend(matches)
+        if signals is None:
+            signals = self.scan_signals(text)
+        max_score, detected_companies = self._max_tier_signal("company", signals["company"])
         
         # Years of experience bonus
-        years_pattern = re.findall(r"(\d+)\+?\s*years?\s+(of\s+)?experience", text, re.IGNORECASE)
+        years_pattern = self.compiled_patterns["years"].findall(text)
         if years_pattern:
             years = max([int(year[0]) for year in years_pattern])
             if years >= 10:
@@ -229,92 +353,110 @@ class EliteTalentDetector:
                 max_score += 0.5
         
         # Default score for any work experience
-        if not detected_companies and re.search(r"\b(engineer|developer|manager|analyst|consultant)\b", text, re.IGNORECASE):
+        if not detected_companies and self.compiled_patterns["role"].search(text):
             max_score = max(max_score, 5.0)
             detected_companies = ["General experience"]
         
         return min(max_score, 10.0), detected_companies
     
-    def detect_leadership_signals(self, text: str) -> Tuple[float, List[str]]:
+    def detect_leadership_signals(self, text: str, signals: Optional[SignalHits] = None) -> Tuple[float, List[str]]:
         """Fast leadership detection"""
-        max_score = 0.0
-        detected_leadership = []
-        
-        for level, data in self.LEADERSHIP_SIGNALS.items():
-            pattern = self.compiled_patterns[f"leadership_{level}"]
-            matches = pattern.findall(text)
-            if matches:
-                weighted_score = data["score"] * data["weight"]
-                max_score = max(max_score, weighted_score)
-                detected_leadership.extend(matches)
-        
-        return max_score, detected_leadership
+        if signals is None:
+            signals = self.scan_signals(text)
+        return self._max_tier_signal("leadership", signals["leadership"])
     
-    def detect_achievement_signals(self, text: str) -> Tuple[float, List[str]]:
+    def detect_achievement_signals(self, text: str, signals: Optional[SignalHits] = None) -> Tuple[float, List[str]]:
         """Fast achievement detection"""
+        if signals is None:
+            signals = self.scan_signals(text)
         total_score = 0.0
         detected_achievements = []
         
-        for level, data in self.ACHIEVEMENT_SIGNALS.items():
-            pattern = self.compiled_patterns[f"achievement_{level}"]
-            matches = pattern.findall(text)
+        for score, matches in zip(self.ACHIEVEMENT_SCORES, signals["achievement"]):
             if matches:
-                weighted_score = data["score"] * data["weight"] * min(len(matches), 3)  # Cap at 3 instances
-                total_score += weighted_score
+                total_score += score * min(len(matches), self.ACHIEVEMENT_INSTANCE_CAP)  # Cap at 3 instances
                 detected_achievements.extend(matches)
+                # Lower tiers can't move a score that is already capped
+                if total_score >= 10.0:
+                    break
         
         return min(total_score, 10.0), detected_achievements
     
-    def detect_skills_match(self, text: str, role: str) -> Tuple[float, List[str]]:
+    def detect_skills_match(self, text: str, role: str, signals: Optional[SignalHits] = None) -> Tuple[float, List[str]]:
         """Fast skills matching for specific role"""
         if role not in self.TECHNICAL_SKILLS:
             role = "software_engineer"  # Default fallback
         
-        skills_config = self.TECHNICAL_SKILLS[role]
+        if signals is None:
+            signals = self.scan_signals(text, role)
+        core_unique, advanced_unique, leadership_unique = (set(matches) for matches in signals["skills"])
+        
         total_score = 0.0
-        detected_skills = []
+        detected_skills = set()
         
         # Core skills (40% weight)
-        core_matches = re.findall(skills_config["core"], text, re.IGNORECASE)
-        if core_matches:
-            core_score = min(len(set(core_matches)) * 1.5, 4.0)  # Max 4 points
-            total_score += core_score
-            detected_skills.extend(core_matches)
+        if core_unique:
+            total_score += min(len(core_unique) * 1.5, 4.0)  # Max 4 points
+            detected_skills |= core_unique
         
         # Advanced skills (35% weight)
-        advanced_matches = re.findall(skills_config["advanced"], text, re.IGNORECASE)
-        if advanced_matches:
-            advanced_score = min(len(set(advanced_matches)) * 2.0, 3.5)  # Max 3.5 points
-            total_score += advanced_score
-            detected_skills.extend(advanced_matches)
+        if advanced_unique:
+            total_score += min(len(advanced_unique) * 2.0, 3.5)  # Max 3.5 points
+            detected_skills |= advanced_unique
         
         # Leadership skills (25% weight)
-        leadership_matches = re.findall(skills_config["leadership"], text, re.IGNORECASE)
-        if leadership_matches:
-            leadership_score = min(len(set(leadership_matches)) * 1.0, 2.5)  # Max 2.5 points
-            total_score += leadership_score
-            detected_skills.extend(leadership_matches)
+        if leadership_unique:
+            total_score += min(len(leadership_unique) * 1.0, 2.5)  # Max 2.5 points
+            detected_skills |= leadership_unique
         
-        return min(total_score, 10.0), list(set(detected_skills))
+        return min(total_score, 10.0), list(detected_skills)
+    
+    def detect_all(self, text: str, role: str) -> Dict[str, Tuple[float, List[str]]]:
+        """Score every evaluation category from a single scan of the text"""
+        signals = self.scan_signals(text, role)
+        return {
+            "education": self.detect_education_signals(text, signals),
+            "experience": self.detect_experience_signals(text, signals),
+            "skills": self.detect_skills_match(text, role, signals),
+            "achievements": self.detect_achievement_signals(text, signals)
+        }
 
 
 class OptimizedFitScore:
     """Ultra-fast FitScore system optimized for 10x speed improvement"""
     
-    def __init__(self):
+    # Keyword detection only looks at the head of a resume; the rest is filler
+    TEXT_LIMIT = 8000
+    
+    # Borderline candidates sent to the LLM together in one verification prompt
+    LLM_BATCH_SIZE = 10
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
         self.detector = EliteTalentDetector()
         
-        # Check if OpenAI API key is available
+        # Check if OpenAI API key is available; only read .env when the environment lacks it
+        if not os.environ.get("OPENAI_API_KEY"):
+            load_dotenv()
         api_key = os.getenv("OPENAI_API_KEY")
         if api_key:
-            self.client = OpenAI(api_key=api_key)
+            # Async client so verification awaits the HTTP round-trip instead of blocking the loop;
+            # callers may pass a shared httpx client so connections are pooled app-wide
+            self.client = AsyncOpenAI(api_key=api_key, http_client=http_client)
             self.mock_mode = False
         else:
             self.client = None
             self.mock_mode = True
             logger.warning("OpenAI API key not found - running in mock mode")
         
-        self.cache = {}  # Simple in-memory cache
+        # Bounded LRU cache fronted by a small hot dict for repeat lookups
+        self.cache = OrderedDict()
+        self.cache_max = 4096
+        self.hot_cache = {}
+        self.hot_cache_max = 64
+        self._cache_lock = threading.Lock()
+        
+        # Upper bound on concurrent LLM verification requests in a batch
+        self.llm_concurrency = 50
         
         # Role-specific benchmarks
         self.role_benchmarks = {
@@ -343,46 +485,86 @@ class OptimizedFitScore:
                 "elite_threshold": 8.2
             }
         }
+        
+        # Scoring weights flattened per role so the weighted sum needs no dict lookups
+        self.role_weights = {
+            role: (
+                benchmarks["education_weight"],
+                benchmarks["experience_weight"],
+                benchmarks["skills_weight"],
+                benchmarks["achievements_weight"]
+            )
+            for role, benchmarks in self.role_benchmarks.items()
+        }
     
-    def _get_cache_key(self, candidate_text: str, role: str) -> str:
+    def _get_cache_key(self, candidate_text: str, role: str) -> Tuple[str, str]:
         """Generate cache key for candidate evaluation"""
-        content = f"{candidate_text[:500]}_{role}"  # Use first 500 chars for caching
-        return hashlib.md5(content.encode()).hexdigest()
+        # Use first 500 chars for caching; str hashing is cached on the object, no digest needed
+        return candidate_text[:500], role
+    
+    def _cache_get(self, cache_key: Tuple[str, str]) -> Optional[EliteScore]:
+        """Look up a cached result, promoting cold hits into the hot cache"""
+        result = self.hot_cache.get(cache_key)
+        if result is not None:
+            return result
+        
+        with self._cache_lock:
+            result = self.cache.get(cache_key)
+            if result is None:
+                return None
+            self.cache.move_to_end(cache_key)
+            self.hot_cache[cache_key] = result
+            if len(self.hot_cache) > self.hot_cache_max:
+                del self.hot_cache[next(iter(self.hot_cache))]
+        
+        return result
+    
+    def _cache_put(self, cache_key: Tuple[str, str], result: EliteScore):
+        """Insert a result, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self.cache[cache_key] = result
+            self.cache.move_to_end(cache_key)
+            if len(self.cache) > self.cache_max:
+                evicted_key, _ = self.cache.popitem(last=False)
+                self.hot_cache.pop(evicted_key, None)
     
     async def evaluate_candidate_fast(self, candidate_text: str, role: str = "software_engineer") -> EliteScore:
         """Ultra-fast candidate evaluation using pattern matching + single LLM call"""
-        start_time = time.time()
+        return self._evaluate_sync(candidate_text, role)
+    
+    def _evaluate_sync(self, candidate_text: str, role: str = "software_engineer") -> EliteScore:
+        """Pattern-matching evaluation; pure CPU work with no awaits"""
+        start_time = time.perf_counter()
         
         # Check cache first
         cache_key = self._get_cache_key(candidate_text, role)
-        if cache_key in self.cache:
-            cached_result = self.cache[cache_key]
-            cached_result.processing_time = time.time() - start_time
+        cached_result = self._cache_get(cache_key)
+        if cached_result is not None:
+            cached_result.processing_time = time.perf_counter() - start_time
             return cached_result
         
         # Get role benchmarks
         benchmarks = self.role_benchmarks.get(role, self.role_benchmarks["software_engineer"])
+        education_weight, experience_weight, skills_weight, achievements_weight = self.role_weights.get(
+            role, self.role_weights["software_engineer"]
+        )
         
-        # Fast pattern matching (parallel execution)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            futures = [
-                executor.submit(self.detector.detect_education_signals, candidate_text),
-                executor.submit(self.detector.detect_experience_signals, candidate_text),
-                executor.submit(self.detector.detect_skills_match, candidate_text, role),
-                executor.submit(self.detector.detect_achievement_signals, candidate_text)
-            ]
-            
-            education_score, education_details = futures[0].result()
-            experience_score, experience_details = futures[1].result()
-            skills_score, skills_details = futures[2].result()
-            achievements_score, achievements_details = futures[3].result()
+        # Clip and lowercase once so every pattern scans a bounded, case-folded slice
+        text_lc = candidate_text[:self.TEXT_LIMIT].lower()
+        
+        # One keyword scan shared by every category - CPU-bound regex work gains nothing from threads under the GIL
+        detections = self.detector.detect_all(text_lc, role)
+        education_score, education_details = detections["education"]
+        experience_score, experience_details = detections["experience"]
+        skills_score, skills_details = detections["skills"]
+        achievements_score, achievements_details = detections["achievements"]
         
         # Calculate weighted overall score
         overall_score = (
-            education_score * benchmarks["education_weight"] +
-            experience_score * benchmarks["experience_weight"] +
-            skills_score * benchmarks["skills_weight"] +
-            achievements_score * benchmarks["achievements_weight"]
+            education_score * education_weight +
+            experience_score * experience_weight +
+            skills_score * skills_weight +
+            achievements_score * achievements_weight
         )
         
         # Determine hire decision based on thresholds
@@ -425,7 +607,7 @@ class OptimizedFitScore:
             60.0 + (len(candidate_text) / 100) + (len(education_details + experience_details + skills_details) * 5)
         )
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         result = EliteScore(
             overall=round(overall_score, 1),
@@ -441,7 +623,7 @@ class OptimizedFitScore:
         )
         
         # Cache the result
-        self.cache[cache_key] = result
+        self._cache_put(cache_key, result)
         
         return result
     
@@ -451,7 +633,7 @@ class OptimizedFitScore:
         fast_result = await self.evaluate_candidate_fast(candidate_text, role)
         
         # If confidence is low or score is borderline, use LLM verification
-        if fast_result.confidence < 70 or 6.5 <= fast_result.overall <= 8.0:
+        if self._needs_verification(fast_result):
             llm_result = await self._llm_verification(candidate_text, fast_result, role)
             return llm_result
         
@@ -459,6 +641,9 @@ class OptimizedFitScore:
     
     async def _llm_verification(self, candidate_text: str, fast_result: EliteScore, role: str) -> EliteScore:
         """Single-shot LLM verification for borderline cases"""
+        # fast_result may be the instance held by the evaluation cache - adjust a copy,
+        # with its own lists since the mock path appends to them
+        fast_result = replace(fast_result, strengths=list(fast_result.strengths), concerns=list(fast_result.concerns))
         
         # If in mock mode, just return the fast result with slight adjustments
         if self.mock_mode:
@@ -493,7 +678,7 @@ class OptimizedFitScore:
         """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4o-mini",  # Faster model
                 messages=[
                     {"role": "system", "content": "You are a fast, accurate talent evaluator. Be concise and decisive."},
@@ -505,19 +690,20 @@ class OptimizedFitScore:
             
             content = response.choices[0].message.content
             
-            # Parse the response (simple regex parsing for speed)
-            score_match = re.search(r"Score.*?(\d+\.?\d*)", content, re.IGNORECASE)
-            decision_match = re.search(r"(HIRE|STRONG_MAYBE|MAYBE|NO_HIRE)", content)
-            confidence_match = re.search(r"Confidence.*?(\d+)", content, re.IGNORECASE)
+            # Parse the fixed tags with plain string scans - no regex engine needed
+            content_lc = content.lower()
+            score = self._number_after(content_lc, "score", decimal=True)
+            decision = self._first_decision(content)
+            confidence = self._number_after(content_lc, "confidence", decimal=False)
             
-            if score_match:
-                fast_result.overall = float(score_match.group(1))
+            if score:
+                fast_result.overall = float(score)
             
-            if decision_match:
-                fast_result.hire_decision = decision_match.group(1)
+            if decision:
+                fast_result.hire_decision = decision
             
-            if confidence_match:
-                fast_result.confidence = float(confidence_match.group(1))
+            if confidence:
+                fast_result.confidence = float(confidence)
             
             # Extract strengths and concerns with simple parsing
             strengths_section = re.search(r"strengths?:?\s*\[(.*?)\]", content, re.IGNORECASE | re.DOTALL)
@@ -536,20 +722,153 @@ class OptimizedFitScore:
         
         return fast_result
     
-    async def batch_evaluate(self, candidates: List[Tuple[str, str]], role: str = "software_engineer") -> List[EliteScore]:
+    @staticmethod
+    def _needs_verification(fast_result: EliteScore) -> bool:
+        """Low-confidence or borderline scores are the ones worth an LLM second look"""
+        return fast_result.confidence < 70 or 6.5 <= fast_result.overall <= 8.0
+    
+    async def evaluate_candidates_batch(self, candidate_texts: List[str], role: str = "software_engineer") -> List[EliteScore]:
+        """Pattern-score every candidate, then verify the borderline ones with one LLM call per batch
+        
+        Same selection rule as evaluate_with_llm_verification, but up to
+        LLM_BATCH_SIZE candidates share a prompt instead of one call each.
+        """
+        results = [self._evaluate_sync(candidate_text, role) for candidate_text in candidate_texts]
+        if self.mock_mode:
+            return results
+        
+        pending = [i for i, result in enumerate(results) if self._needs_verification(result)]
+        # Verification adjusts results in place; give each pending slot its own copy so the
+        # cached instance (shared by duplicate texts in the batch) keeps the fast scores
+        for i in pending:
+            results[i] = replace(results[i])
+        batches = [pending[i:i + self.LLM_BATCH_SIZE] for i in range(0, len(pending), self.LLM_BATCH_SIZE)]
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        
+        async def verify_batch(indices: List[int]) -> None:
+            async with semaphore:
+                await self._llm_verification_batch(
+                    [candidate_texts[i] for i in indices], [results[i] for i in indices], role
+                )
+        
+        await asyncio.gather(*(verify_batch(indices) for indices in batches))
+        return results
+    
+    async def _llm_verification_batch(self, candidate_texts: List[str], fast_results: List[EliteScore], role: str) -> None:
+        """Single LLM call verifying several candidates; updates fast_results in place"""
+        candidates = "".join(
+            f"""
+        CANDIDATE #{n}: {candidate_text[:2000]}
+        INITIAL ASSESSMENT #{n}: Education {r.education}/10, Experience {r.experience}/10, Skills {r.skills}/10, Achievements {r.achievements}/10, Overall {r.overall}/10
+        """
+            for n, (candidate_text, r) in enumerate(zip(candidate_texts, fast_results), 1)
+        )
+        prompt = f"""
+        You are an elite talent evaluator. Quickly assess these {len(fast_results)} candidates for {role}.
+        {candidates}
+        For EACH candidate answer on exactly one line, in this form:
+        #N: Score X.X | Decision HIRE/STRONG_MAYBE/MAYBE/NO_HIRE | Confidence XX
+        
+        Focus on: Technical excellence, Impact scale, Leadership potential
+        """
+        
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",  # Faster model
+                messages=[
+                    {"role": "system", "content": "You are a fast, accurate talent evaluator. Be concise and decisive."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.1,
+                max_tokens=40 * len(fast_results)  # One short line per candidate
+            )
+            
+            for line in response.choices[0].message.content.splitlines():
+                line = line.strip()
+                number, sep, verdict = line[1:].partition(":")
+                if not line.startswith("#") or not sep or not number.strip().isdecimal():
+                    continue
+                n = int(number)
+                if not 1 <= n <= len(fast_results):
+                    continue
+                
+                fast_result = fast_results[n - 1]
+                verdict_lc = verdict.lower()
+                score = self._number_after(verdict_lc, "score", decimal=True)
+                decision = self._first_decision(verdict)
+                confidence = self._number_after(verdict_lc, "confidence", decimal=False)
+                
+                if score:
+                    fast_result.overall = float(score)
+                if decision:
+                    fast_result.hire_decision = decision
+                if confidence:
+                    fast_result.confidence = float(confidence)
+                
+        except Exception as e:
+            logger.error(f"Batch LLM verification failed: {e}")
+            # Keep the fast results if the LLM fails
+    
+    @staticmethod
+    def _number_after(content_lc: str, tag: str, decimal: bool) -> Optional[str]:
+        """First number following a tag on the same line, trying each occurrence of the tag in turn
+        
+        Scans the lowercased text only: lower() may change the length of the string, so
+        offsets found in it cannot index the original. Digits are unchanged by lowercasing.
+        """
+        start = content_lc.find(tag)
+        while start >= 0:
+            line_end = content_lc.find("\n", start)
+            if line_end < 0:
+                line_end = len(content_lc)
+            
+            i = start + len(tag)
+            while i < line_end and not content_lc[i].isdecimal():
+                i += 1
+            if i < line_end:
+                j = i
+                while j < line_end and content_lc[j].isdecimal():
+                    j += 1
+                if decimal and j < line_end and content_lc[j] == ".":
+                    j += 1
+                    while j < line_end and content_lc[j].isdecimal():
+                        j += 1
+                return content_lc[i:j]
+            
+            # No digits left on this line; later occurrences on it would fail the same way
+            start = content_lc.find(tag, line_end)
+        return None
+    
+    @staticmethod
+    def _first_decision(content: str) -> Optional[str]:
+        """Leftmost hire decision keyword, so NO_HIRE is not mistaken for the HIRE inside it"""
+        best_pos, best = len(content), None
+        for decision in ("HIRE", "STRONG_MAYBE", "MAYBE", "NO_HIRE"):
+            # Only accept a match that starts before the best one found so far
+            pos = content.find(decision, 0, best_pos + len(decision) - 1)
+            if pos >= 0:
+                best_pos, best = pos, decision
+        return best
+    
+    async def batch_evaluate(self, candidates: List[Tuple[str, str]], role: str = "software_engineer",
+                             verify: bool = False) -> List[EliteScore]:
         """Batch evaluation for multiple candidates with parallel processing"""
-        start_time = time.time()
-        
-        # Process in parallel
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            futures = [
-                executor.submit(asyncio.run, self.evaluate_candidate_fast(candidate_text, role))
-                for candidate_text, _ in candidates
-            ]
+        start_time = time.perf_counter()
+        
+        if verify:
+            # Fan out LLM verifications concurrently, bounded to respect API rate limits
+            semaphore = asyncio.Semaphore(self.llm_concurrency)
             
-            results = [future.result() for future in futures]
+            async def verify_one(candidate_text: str) -> EliteScore:
+                async with semaphore:
+                    return await self.evaluate_with_llm_verification(candidate_text, role)
+            
+            results = await asyncio.gather(*(verify_one(candidate_text) for candidate_text, _ in candidates))
+        else:
+            # Pattern scoring is pure-Python CPU work; threads only add hops under the GIL
+            results = [self._evaluate_sync(candidate_text, role) for candidate_text, _ in candidates]
         
-        batch_time = time.time() - start_time
+        batch_time = time.perf_counter() - start_time
         logger.info(f"Batch processed {len(candidates)} candidates in {batch_time:.2f} seconds")
         
         return results
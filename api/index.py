@@ -1,10 +1,10 @@
 from fastapi import FastAPI, Form, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 import re
 import time
 from typing import List
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Simplified elite detection patterns
 ELITE_PATTERNS = {
@@ -24,30 +24,52 @@ ELITE_PATTERNS = {
     }
 }
 
+# Compiled once at import, so requests skip re's per-call pattern cache lookup
+COMPILED_PATTERNS = {
+    category: [(re.compile(pattern, re.IGNORECASE), score) for pattern, score in groups.items()]
+    for category, groups in ELITE_PATTERNS.items()
+}
+
+# Lowercase bytes variants for ASCII text, which re scans far faster without IGNORECASE
+ASCII_PATTERNS = {
+    category: [(re.compile(pattern.lower().encode("ascii")), score) for pattern, score in groups.items()]
+    for category, groups in ELITE_PATTERNS.items()
+}
+
+def _findall(category: str, text: str, buffer: bytes) -> list:
+    """(matches in original casing, score) per pattern of a category
+    
+    buffer is the lowercased ASCII encoding of text, or None when text is not ASCII.
+    """
+    if buffer is None:
+        return [(regex.findall(text), score) for regex, score in COMPILED_PATTERNS[category]]
+    return [
+        ([text[match.start():match.end()] for match in regex.finditer(buffer)], score)
+        for regex, score in ASCII_PATTERNS[category]
+    ]
+
 def evaluate_text(text: str) -> dict:
     """Simple text-based evaluation"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     scores = {"education": 0, "experience": 0, "skills": 0}
     matches = {"education": [], "experience": [], "skills": []}
+    buffer = text.encode("ascii").lower() if text.isascii() else None
     
     # Education scoring
-    for pattern, score in ELITE_PATTERNS["education"].items():
-        found = re.findall(pattern, text, re.IGNORECASE)
+    for found, score in _findall("education", text, buffer):
         if found:
             scores["education"] = max(scores["education"], score)
             matches["education"].extend(found)
     
     # Experience scoring  
-    for pattern, score in ELITE_PATTERNS["companies"].items():
-        found = re.findall(pattern, text, re.IGNORECASE)
+    for found, score in _findall("companies", text, buffer):
         if found:
             scores["experience"] = max(scores["experience"], score)
             matches["experience"].extend(found)
     
     # Skills scoring
-    for pattern, score in ELITE_PATTERNS["skills"].items():
-        found = re.findall(pattern, text, re.IGNORECASE)
+    for found, score in _findall("skills", text, buffer):
         if found:
             scores["skills"] += min(len(found) * score, 10)
     
@@ -64,7 +86,7 @@ def evaluate_text(text: str) -> dict:
     else:
         decision = "NO_HIRE"
     
-    processing_time = time.time() - start_time
+    processing_time = time.perf_counter() - start_time
     
     return {
         "overall": round(overall, 1),
@@ -10,6 +10,7 @@ import time
 import json
 import asyncio
 import re
+from collections import OrderedDict
 from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor
@@ -17,7 +18,8 @@ import hashlib
 
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse
 import fitz  # PyMuPDF for PDF processing
 from dotenv import load_dotenv
 
@@ -52,124 +54,212 @@ class EliteScore:
         }
 
 class FastEliteTalentDetector:
-    """Simplified elite talent detection for Vercel"""
+    """Simplified elite talent detection for Vercel
+    
+    Patterns are lowercase and case-sensitive; detect_pattern_score expects
+    text that has already been lowercased (evaluate_candidate does this once).
+    """
+    
+    # Matches kept per tier before only new distinct values are recorded - enough to
+    # saturate confidence (7 x 5 points), achievement counts (3) and the rendered previews
+    MATCH_CAP = 7
+    
+    # Elite universities with scores
+    elite_unis = {
+        r"\b(MIT|Stanford|Harvard|Berkeley|UC Berkeley|Caltech|Princeton|Yale|Columbia|UPenn|Cornell)\b": 9.5,
+        r"\b(Waterloo|Georgia Tech|CMU|Carnegie Mellon|UIUC|UT Austin|University of Washington|UW)\b": 9.2,
+        r"\b(Oxford|Cambridge|ETH|IIT|Indian Institute of Technology|Tsinghua|Peking University)\b": 9.0,
+        r"\b(UCLA|USC|Michigan|Northwestern|Duke|University of Chicago)\b": 7.8,
+        r"\b(UCSD|UC San Diego|Wisconsin|Virginia|UVA|North Carolina|UNC)\b": 6.5
+    }
+    
+    # Elite companies with scores
+    elite_companies = {
+        r"\b(Google|Meta|Facebook|Apple|Netflix|Amazon|Microsoft)\b": 9.5,
+        r"\b(Stripe|Scale AI|Databricks|Figma|Notion|Linear|OpenAI|Anthropic|Airbnb|Uber)\b": 9.2,
+        r"\b(Coinbase|Snowflake|Palantir|Slack|Zoom|Dropbox|Twilio|GitLab)\b": 8.7,
+        r"\b(McKinsey|Bain|BCG|Boston Consulting|Deloitte Consulting)\b": 8.5,
+        r"\b(Goldman Sachs|Morgan Stanley|JP Morgan|JPMorgan|Blackstone|KKR|Citadel)\b": 8.3
+    }
+    
+    # Achievement patterns
+    achievements = {
+        r"\b(patent|published|publication|TED talk|keynote|conference speaker|open source|GitHub|acquisition|IPO|Forbes|YC|Y Combinator|founder|co-founder)\b": 9.0,
+        r"\b(award|recognition|promotion|mentored|scaled|optimized|launched|increased \d+%|reduced \d+%|grew \d+%|saved \$|revenue \$)\b": 7.5,
+        r"\b(improved|enhanced|developed|built|created|designed|implemented)\b": 6.0
+    }
+    
+    # Technical skills for software engineers
+    tech_skills = {
+        r"\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|React|Node\.js|Django|Flask|Spring|Kubernetes|Docker|AWS|GCP|Azure)\b": 2.0,
+        r"\b(system design|microservices|distributed systems|scalability|performance optimization|machine learning|AI|blockchain)\b": 3.0,
+        r"\b(architecture|technical leadership|code review|mentoring|hiring|team building)\b": 2.5
+    }
+    
+    # Weighted overall score and hire threshold per role, with the weights folded in as
+    # integer percentages: category scores in tenths -> (overall, threshold) in thousandths
+    role_scorers = {
+        "software_engineer": lambda edu, exp, skills, ach: (edu * 15 + exp * 35 + skills * 25 + ach * 25, 7500),
+        "product_manager": lambda edu, exp, skills, ach: (edu * 10 + exp * 40 + skills * 30 + ach * 20, 7000),
+        "data_scientist": lambda edu, exp, skills, ach: (edu * 20 + exp * 30 + skills * 35 + ach * 15, 7200)
+    }
     
     def __init__(self):
-        # Elite universities with scores
-        self.elite_unis = {
-            r"\b(MIT|Stanford|Harvard|Berkeley|UC Berkeley|Caltech|Princeton|Yale|Columbia|UPenn|Cornell)\b": 9.5,
-            r"\b(Waterloo|Georgia Tech|CMU|Carnegie Mellon|UIUC|UT Austin|University of Washington|UW)\b": 9.2,
-            r"\b(Oxford|Cambridge|ETH|IIT|Indian Institute of Technology|Tsinghua|Peking University)\b": 9.0,
-            r"\b(UCLA|USC|Michigan|Northwestern|Duke|University of Chicago)\b": 7.8,
-            r"\b(UCSD|UC San Diego|Wisconsin|Virginia|UVA|North Carolina|UNC)\b": 6.5
-        }
+        self._compile_scanner()
+    
+    @classmethod
+    def _compile_scanner(cls):
+        """Fuse every category's tiers and the generic probes into one regex
         
-        # Elite companies with scores
-        self.elite_companies = {
-            r"\b(Google|Meta|Facebook|Apple|Netflix|Amazon|Microsoft)\b": 9.5,
-            r"\b(Stripe|Scale AI|Databricks|Figma|Notion|Linear|OpenAI|Anthropic|Airbnb|Uber)\b": 9.2,
-            r"\b(Coinbase|Snowflake|Palantir|Slack|Zoom|Dropbox|Twilio|GitLab)\b": 8.7,
-            r"\b(McKinsey|Bain|BCG|Boston Consulting|Deloitte Consulting)\b": 8.5,
-            r"\b(Goldman Sachs|Morgan Stanley|JP Morgan|JPMorgan|Blackstone|KKR|Citadel)\b": 8.3
-        }
+        Compiled state lives on the class, so it is built once and shared by every instance.
+        """
+        if "_scanner" in cls.__dict__:
+            return
         
-        # Achievement patterns
-        self.achievements = {
-            r"\b(patent|published|publication|TED talk|keynote|conference speaker|open source|GitHub|acquisition|IPO|Forbes|YC|Y Combinator|founder|co-founder)\b": 9.0,
-            r"\b(award|recognition|promotion|mentored|scaled|optimized|launched|increased \d+%|reduced \d+%|grew \d+%|saved \$|revenue \$)\b": 7.5,
-            r"\b(improved|enhanced|developed|built|created|designed|implemented)\b": 6.0
+        # Per-tier scores as integer tenths, indexed like the scanner's hit buckets
+        categories = {
+            "edu": cls.elite_unis,
+            "exp": cls.elite_companies,
+            "ach": cls.achievements,
+            "skill": cls.tech_skills
         }
-        
-        # Technical skills for software engineers
-        self.tech_skills = {
-            r"\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|React|Node\.js|Django|Flask|Spring|Kubernetes|Docker|AWS|GCP|Azure)\b": 2.0,
-            r"\b(system design|microservices|distributed systems|scalability|performance optimization|machine learning|AI|blockchain)\b": 3.0,
-            r"\b(architecture|technical leadership|code review|mentoring|hiring|team building)\b": 2.5
+        cls.tier_scores = {
+            category: tuple(round(score * 10) for score in patterns.values())
+            for category, patterns in categories.items()
         }
+        
+        # Matches come back lowercased, so remember how each plain literal is spelled
+        cls.display_names = {}
+        for patterns in categories.values():
+            for pattern in patterns:
+                for alt in pattern[3:-3].split("|"):
+                    literal = re.sub(r"\\(\W)", r"\1", alt)
+                    if re.fullmatch(alt, literal):
+                        cls.display_names[literal.lower()] = literal
+        
+        # One entry per (category, tier), then the generic fallback probes: any degree,
+        # any role. Each tier is wrapped as \b(...)\b - strip it and re-apply per entry
+        cls._tier_slots = tuple(
+            (category, i)
+            for category, patterns in categories.items()
+            for i in range(len(patterns))
+        )
+        alternations = [
+            pattern[3:-3].lower() for patterns in categories.values() for pattern in patterns
+        ] + ["degree|bachelor|master|phd|bs|ms|mba", "engineer|developer|manager|analyst|consultant"]
+        # The scanner stops wherever some entry starts and tries each entry there in its
+        # own lookahead, so entries match independently, exactly as a separate scan per
+        # tier would: "scale ai" is a company and its "ai" still a skill
+        entries = "".join(f"(?:(?=({alternation})\\b)|)" for alternation in alternations)
+        scanner = (
+            rf"\b(?=(?:{'|'.join(alternations)})\b){entries}"
+            # ...and years of experience, which may start mid-word
+            r"|(\d+)\+?\s*years?\s+(?:of\s+)?experience"
+        )
+        cls._scanner = re.compile(scanner)
     
-    def detect_pattern_score(self, text: str, patterns: Dict[str, float]) -> Tuple[float, List[str]]:
-        """Detect patterns and return max score + matches"""
-        max_score = 0.0
-        matches = []
+    def _scan(self, text: str) -> Tuple[Dict[str, List[List[str]]], int, bool, bool]:
+        """Single pass over the text: tier hits per category, most years mentioned, degree and role flags"""
+        hits = {category: [[] for _ in scores] for category, scores in self.tier_scores.items()}
+        years = 0
+        has_degree = has_role = False
         
-        for pattern, score in patterns.items():
-            found = re.findall(pattern, text, re.IGNORECASE)
+        # Where each tier's last hit ended: like findall on that tier alone, hits of one
+        # tier never overlap each other
+        ends = [0] * len(self._tier_slots)
+        for match in self._scanner.finditer(text):
+            *found, degree, role, year = match.groups()
+            if year is not None:
+                years = max(years, int(year))
+                continue
+            has_degree = has_degree or degree is not None
+            has_role = has_role or role is not None
+            start = match.start()
+            for tier, name in enumerate(found):
+                if name is None or start < ends[tier]:
+                    continue
+                ends[tier] = start + len(name)
+                category, i = self._tier_slots[tier]
+                bucket = hits[category][i]
+                name = self.display_names.get(name, name)
+                # Past the cap only a new distinct value can still move the skills score
+                if len(bucket) < self.MATCH_CAP or name not in bucket:
+                    bucket.append(name)
+        
+        return hits, years, has_degree, has_role
+    
+    def detect_pattern_score(self, category: str, tiers: List[List[str]]) -> Tuple[int, List[str]]:
+        """Max score (in tenths) among matched tiers + distinct matches in tier order"""
+        max_score = 0
+        # Ordered set: repeated mentions of the same school or company are kept once
+        seen: Dict[str, None] = {}
+        
+        for score, found in zip(self.tier_scores[category], tiers):
             if found:
                 max_score = max(max_score, score)
-                matches.extend(found)
+                seen.update(dict.fromkeys(found))
         
-        return max_score, matches
+        return max_score, list(seen)
     
     def evaluate_candidate(self, text: str, role: str = "software_engineer") -> EliteScore:
-        """Fast candidate evaluation"""
-        start_time = time.time()
+        """Fast candidate evaluation
+        
+        Category scores are kept as integer tenths (0-100) and only converted
+        to floats for the returned EliteScore.
+        """
+        start_time = time.perf_counter()
+        
+        # Lowercase once so every pattern can match case-sensitively
+        text_lower = text.lower()
+        
+        # One scan for every category and the generic probes
+        hits, years, has_degree, has_role = self._scan(text_lower)
         
         # Education scoring
-        edu_score, edu_matches = self.detect_pattern_score(text, self.elite_unis)
-        if not edu_matches and re.search(r"\b(degree|bachelor|master|phd|bs|ms|mba)\b", text, re.IGNORECASE):
-            edu_score = 5.0
+        edu_score, edu_matches = self.detect_pattern_score("edu", hits["edu"])
+        if not edu_matches and has_degree:
+            edu_score = 50
             edu_matches = ["General degree"]
         
         # Experience scoring
-        exp_score, exp_matches = self.detect_pattern_score(text, self.elite_companies)
+        exp_score, exp_matches = self.detect_pattern_score("exp", hits["exp"])
         # Years bonus
-        years_pattern = re.findall(r"(\d+)\+?\s*years?\s+(of\s+)?experience", text, re.IGNORECASE)
-        if years_pattern:
-            years = max([int(year[0]) for year in years_pattern])
-            if years >= 10:
-                exp_score += 1.0
-            elif years >= 5:
-                exp_score += 0.5
+        exp_score += 10 if years >= 10 else 5 if years >= 5 else 0
         
-        if not exp_matches and re.search(r"\b(engineer|developer|manager|analyst|consultant)\b", text, re.IGNORECASE):
-            exp_score = max(exp_score, 5.0)
+        if not exp_matches and has_role:
+            exp_score = max(exp_score, 50)
             exp_matches = ["General experience"]
         
         # Skills scoring
         skills_score = 0
         skills_matches = []
-        for pattern, score in self.tech_skills.items():
-            found = re.findall(pattern, text, re.IGNORECASE)
+        for score, found in zip(self.tier_scores["skill"], hits["skill"]):
             if found:
-                skills_score += min(len(set(found)) * score, score * 2)
+                # Only "one vs. at least two distinct" matters; count() avoids hashing into a set
+                distinct = 1 if found.count(found[0]) == len(found) else 2
+                skills_score += score * distinct
                 skills_matches.extend(found)
-        skills_score = min(skills_score, 10.0)
+        skills_score = min(skills_score, 100)
         
         # Achievements scoring
         ach_score = 0
         ach_matches = []
-        for pattern, score in self.achievements.items():
-            found = re.findall(pattern, text, re.IGNORECASE)
+        for score, found in zip(self.tier_scores["ach"], hits["ach"]):
             if found:
-                ach_score += min(len(found) * (score/3), score)
+                ach_score += min(len(found) * score // 3, score)
                 ach_matches.extend(found)
-        ach_score = min(ach_score, 10.0)
+        ach_score = min(ach_score, 100)
         
-        # Role-specific weights
-        if role == "software_engineer":
-            weights = {"education": 0.15, "experience": 0.35, "skills": 0.25, "achievements": 0.25}
-            hire_threshold = 7.5
-        elif role == "product_manager":
-            weights = {"education": 0.10, "experience": 0.40, "skills": 0.30, "achievements": 0.20}
-            hire_threshold = 7.0
-        else:  # data_scientist
-            weights = {"education": 0.20, "experience": 0.30, "skills": 0.35, "achievements": 0.15}
-            hire_threshold = 7.2
-        
-        # Calculate overall score
-        overall = (
-            edu_score * weights["education"] +
-            exp_score * weights["experience"] +
-            skills_score * weights["skills"] +
-            ach_score * weights["achievements"]
-        )
+        # Role-specific weighted overall score and hire threshold
+        role_score = self.role_scorers.get(role, self.role_scorers["data_scientist"])
+        overall, hire_threshold = role_score(edu_score, exp_score, skills_score, ach_score)
         
         # Determine hire decision
-        if overall >= 8.5:
+        if overall >= 8500:
             decision = "HIRE"
         elif overall >= hire_threshold:
             decision = "STRONG_MAYBE"
-        elif overall >= 6.0:
+        elif overall >= 6000:
             decision = "MAYBE"
         else:
             decision = "NO_HIRE"
@@ -178,37 +268,37 @@ class FastEliteTalentDetector:
         strengths = []
         concerns = []
         
-        if edu_score >= 8.0:
+        if edu_score >= 80:
             strengths.append(f"Elite education: {', '.join(edu_matches[:2])}")
-        elif edu_score < 6.0:
+        elif edu_score < 60:
             concerns.append("Education background below expectations")
         
-        if exp_score >= 8.0:
+        if exp_score >= 80:
             strengths.append(f"Top-tier experience: {', '.join(exp_matches[:2])}")
-        elif exp_score < 6.0:
+        elif exp_score < 60:
             concerns.append("Limited relevant experience")
         
-        if skills_score >= 8.0:
+        if skills_score >= 80:
             strengths.append(f"Strong technical skills: {', '.join(skills_matches[:3])}")
-        elif skills_score < 6.0:
+        elif skills_score < 60:
             concerns.append("Missing key technical skills")
         
-        if ach_score >= 7.0:
+        if ach_score >= 70:
             strengths.append(f"Notable achievements: {', '.join(ach_matches[:2])}")
-        elif ach_score < 4.0:
+        elif ach_score < 40:
             concerns.append("Limited demonstrated impact")
         
         # Calculate confidence
-        confidence = min(95.0, 60.0 + (len(text) / 100) + (len(edu_matches + exp_matches + skills_matches) * 5))
+        confidence = min(95.0, 60.0 + (len(text) / 100) + ((len(edu_matches) + len(exp_matches) + len(skills_matches)) * 5))
         
-        processing_time = time.time() - start_time
+        processing_time = time.perf_counter() - start_time
         
         return EliteScore(
-            overall=round(overall, 1),
-            education=round(edu_score, 1),
-            experience=round(exp_score, 1),
-            skills=round(skills_score, 1),
-            achievements=round(ach_score, 1),
+            overall=(overall + 50) // 100 / 10,  # thousandths -> tenths, rounding half up
+            education=edu_score / 10,
+            experience=exp_score / 10,
+            skills=skills_score / 10,
+            achievements=ach_score / 10,
             confidence=round(confidence, 1),
             hire_decision=decision,
             strengths=strengths[:3],
@@ -220,9 +310,13 @@ class FastEliteTalentDetector:
 app = FastAPI(
     title="Fast FitScore Test App",
     description="Simplified FitScore testing - 10x faster elite talent detection",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Compress the landing page and larger JSON bodies
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -235,13 +329,29 @@ app.add_middleware(
 # Initialize detector
 detector = FastEliteTalentDetector()
 
+# Shared, bounded pool for CPU-bound work so requests don't block the event loop
+_SCORE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="fitscore")
+
+# PyMuPDF is not thread-safe, so PDF parsing gets its own single worker
+_PDF_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fitscore-pdf")
+
+# Uploads larger than this are rejected while streaming, matching the UI's stated limit
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+# Evaluations keyed by (resume digest, role) so re-uploads skip PDF parsing and scoring
+EVAL_CACHE_MAX = 512
+_eval_cache: "OrderedDict[Tuple[bytes, str], Dict[str, Any]]" = OrderedDict()
+
 async def extract_pdf_text(pdf_bytes: bytes) -> str:
+    """Extract text from PDF bytes without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PDF_POOL, _extract_pdf_text_sync, pdf_bytes)
+
+def _extract_pdf_text_sync(pdf_bytes: bytes) -> str:
     """Extract text from PDF bytes"""
     try:
         with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            text = "".join(page.get_text() for page in doc)
         return text if text.strip() else "Could not extract text from PDF"
     except Exception as e:
         return f"Error extracting PDF text: {str(e)}"
@@ -437,7 +547,8 @@ async def get_test_interface():
     </body>
     </html>
     """
-    return html_content
+    # The page is static, so let browsers cache it
+    return HTMLResponse(content=html_content, headers={"Cache-Control": "public, max-age=3600"})
 
 @app.post("/analyze")
 async def analyze_candidate(
@@ -446,24 +557,47 @@ async def analyze_candidate(
     resume: UploadFile = File(...)
 ):
     """Analyze candidate using simplified fast evaluation"""
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     try:
         if not resume.filename.lower().endswith('.pdf'):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        pdf_bytes = await resume.read()
-        resume_text = await extract_pdf_text(pdf_bytes)
-        
-        if not resume_text or len(resume_text.strip()) < 50:
-            raise HTTPException(status_code=400, detail="Could not extract meaningful text from PDF")
+        # Read in chunks so oversize uploads are rejected before they are fully buffered
+        buffer = bytearray()
+        while chunk := await resume.read(65536):
+            buffer.extend(chunk)
+            if len(buffer) > MAX_UPLOAD_BYTES:
+                raise HTTPException(status_code=413, detail="PDF exceeds 10 MB")
+        pdf_bytes = bytes(buffer)
         
-        # Run fast evaluation
-        elite_score = detector.evaluate_candidate(resume_text, role_type)
+        cache_key = (hashlib.blake2b(pdf_bytes, digest_size=16).digest(), role_type)
+        evaluation = _eval_cache.get(cache_key)
+        if evaluation is not None:
+            _eval_cache.move_to_end(cache_key)
+        else:
+            # Text sent under a .pdf name skips the PDF parser; real PDFs carry their
+            # header within the first 1 KB
+            if b"%PDF-" in pdf_bytes[:1024]:
+                resume_text = await extract_pdf_text(pdf_bytes)
+            else:
+                resume_text = pdf_bytes.decode("utf-8", errors="ignore")
+            
+            if not resume_text or len(resume_text.strip()) < 50:
+                raise HTTPException(status_code=400, detail="Could not extract meaningful text from PDF")
+            
+            # Run fast evaluation off the event loop
+            loop = asyncio.get_running_loop()
+            elite_score = await loop.run_in_executor(_SCORE_POOL, detector.evaluate_candidate, resume_text, role_type)
+            evaluation = elite_score.to_dict()
+            
+            _eval_cache[cache_key] = evaluation
+            if len(_eval_cache) > EVAL_CACHE_MAX:
+                _eval_cache.popitem(last=False)
         
         return {
-            "evaluation": elite_score.to_dict(),
-            "processing_time": round(time.time() - start_time, 2),
+            "evaluation": evaluation,
+            "processing_time": round(time.perf_counter() - start_time, 2),
             "status": "success"
         }
         
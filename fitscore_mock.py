@@ -0,0 +1,48 @@
+"""
+Stand-in FitScore engine for fitscore_test_app when the optimized engine
+can't be imported; kept out of the app module so the normal path never loads it
+"""
+
+import asyncio
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List
+
+@dataclass
+class EliteScore:
+    overall: float
+    education: float
+    experience: float
+    skills: float
+    achievements: float
+    confidence: float
+    hire_decision: str
+    strengths: List[str]
+    concerns: List[str]
+    processing_time: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return asdict(self)
+
+class OptimizedFitScore:
+    def __init__(self, http_client=None):
+        pass
+    
+    async def evaluate_candidate_fast(self, candidate_text: str, role: str = "software_engineer") -> EliteScore:
+        # Mock implementation for testing
+        await asyncio.sleep(1)  # Simulate processing time
+        return EliteScore(
+            overall=7.5,
+            education=8.0,
+            experience=7.0,
+            skills=7.5,
+            achievements=7.0,
+            confidence=85.0,
+            hire_decision="STRONG_MAYBE",
+            strengths=["Strong technical background", "Good experience"],
+            concerns=["Limited leadership experience"],
+            processing_time=1.0
+        )
+    
+    async def evaluate_candidates_batch(self, candidate_texts: List[str], role: str = "software_engineer") -> List[EliteScore]:
+        return list(await asyncio.gather(*(self.evaluate_candidate_fast(text, role) for text in candidate_texts)))
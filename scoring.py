@@ -0,0 +1,89 @@
+import re
+import string
+import ahocorasick
+
+# Case folding that keeps offsets, for the rare text where lower() does not: ASCII
+# plus the non-ASCII letters re.IGNORECASE also equates with i, s and k
+_FOLD = str.maketrans({**{c: c.lower() for c in string.ascii_uppercase},
+                       "\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+def fold_case(text: str) -> str:
+    """Lowercased text with the same length and offsets as the original"""
+    text_lc = text.lower()
+    if len(text_lc) != len(text) or "\u0131" in text_lc or "\u017f" in text_lc:
+        return text.translate(_FOLD)
+    return text_lc
+
+def _is_word(char: str) -> bool:
+    """Whether char is a regex word character (alphanumeric or underscore)"""
+    return char.isalnum() or char == "_"
+
+class KeywordScanner:
+    """Whole-word, case-insensitive matcher for tables of keyword patterns
+
+    Built once per pattern table at import and shared read-only by every request.
+    tables maps a category to its pattern sources, each a word-bounded alternation
+    of literal keywords ("\\b(a|b|c)\\b", with regex escapes such as "C\\+\\+"); group
+    N of a category is its Nth pattern. A keyword may appear in several groups.
+    """
+    __slots__ = ("_automaton", "_groups")
+
+    def __init__(self, tables: dict):
+        self._groups = tuple((category, len(patterns)) for category, patterns in tables.items())
+        targets = {}
+        for index, patterns in enumerate(tables.values()):
+            for group, pattern in enumerate(patterns):
+                for keyword in pattern[3:-3].split("|"):
+                    keyword = re.sub(r"\\(.)", r"\1", keyword).lower()
+                    targets.setdefault(keyword, []).append((index, group))
+        self._automaton = ahocorasick.Automaton()
+        for keyword, where in targets.items():
+            # \b needs a word character on exactly one side, so a keyword that ends in
+            # a non-word character such as "+" must be followed by a word character
+            self._automaton.add_word(
+                keyword,
+                (len(keyword), tuple(where), _is_word(keyword[0]), _is_word(keyword[-1])),
+            )
+        self._automaton.make_automaton()
+
+    def scan(self, text: str) -> dict:
+        """Single pass over the text collecting whole-word keyword hits
+
+        Returns {category: [hits of group 0, hits of group 1, ...]} with each hit in
+        its original casing and in text order, as per-pattern re.findall would. One
+        difference: overlapping keywords of the same group are each reported ("UC
+        Berkeley" also yields "Berkeley"), where findall keeps only the leftmost.
+        """
+        found = tuple([[] for _ in range(size)] for _, size in self._groups)
+        last = len(text) - 1
+        for end, (length, where, word_start, word_end) in self._automaton.iter(fold_case(text)):
+            start = end - length + 1
+            # \b on each side: exactly one of the two adjacent characters is a word character
+            if start > 0:
+                before = text[start - 1]
+                if (before.isalnum() or before == "_") == word_start:
+                    continue
+            elif not word_start:
+                continue
+            if end < last:
+                after = text[end + 1]
+                if (after.isalnum() or after == "_") == word_end:
+                    continue
+            elif not word_end:
+                continue
+            hit = text[start:end + 1]
+            for index, group in where:
+                found[index][group].append(hit)
+        return {category: hits for (category, _), hits in zip(self._groups, found)}
+
+def best_score(found_by_group: list, scores: tuple) -> float:
+    """Highest score among the groups with any hit, or 0"""
+    return max((score for found, score in zip(found_by_group, scores) if found), default=0)
+
+def capped_sum(found_by_group: list, scores: tuple, cap: float) -> float:
+    """Sum over groups with hits of hit count times score, each term capped at cap"""
+    return sum(min(len(found) * score, cap) for found, score in zip(found_by_group, scores) if found)
+
+def hit_sum(found_by_group: list, scores: tuple) -> float:
+    """Sum over groups with hits of hit count times score, uncapped"""
+    return sum(len(found) * score for found, score in zip(found_by_group, scores) if found)
@@ -0,0 +1,80 @@
+import asyncio
+
+import httpx
+import pytest
+
+import app
+from app import FastEliteTalentDetector
+
+RESUME = b"Stanford PhD, Google staff engineer working on Python, AWS and machine learning."
+
+
+def analyze(content: bytes, role: str = "software_engineer") -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(
+                "/analyze",
+                data={"job_description": "Backend engineer", "role_type": role},
+                files={"resume": ("resume.pdf", content, "application/pdf")},
+            )
+    return asyncio.run(send())
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return FastEliteTalentDetector()
+
+
+def test_company_does_not_hide_overlapping_skill(detector):
+    hits, _, _, _ = detector._scan("worked at scale ai")
+    assert hits["exp"][1] == ["Scale AI"]
+    assert hits["skill"][1] == ["AI"]
+    assert detector.evaluate_candidate("Worked at Scale AI").skills == 3.0
+
+
+def test_tier_hits_do_not_overlap_within_a_tier(detector):
+    hits, _, _, _ = detector._scan("uc berkeley")
+    assert hits["edu"][0] == ["UC Berkeley"]
+
+
+def test_probes_share_the_scan(detector):
+    _, years, has_degree, has_role = detector._scan("phd, engineer with x12 years of experience and 3 years experience")
+    assert (years, has_degree, has_role) == (12, True, True)
+
+
+@pytest.fixture
+def empty_eval_cache():
+    app._eval_cache.clear()
+    yield
+    app._eval_cache.clear()
+
+
+def test_repeated_upload_is_served_from_cache(empty_eval_cache, monkeypatch):
+    first = analyze(RESUME).json()["evaluation"]
+
+    def fail(*args):
+        raise AssertionError("scored a cached resume")
+
+    monkeypatch.setattr(app.detector, "evaluate_candidate", fail)
+    assert analyze(RESUME).json()["evaluation"] == first
+    # The role is part of the key, so another role reaches the stubbed detector
+    assert analyze(RESUME, "data_scientist").status_code == 500
+
+
+def test_eval_cache_is_bounded(empty_eval_cache, monkeypatch):
+    monkeypatch.setattr(app, "EVAL_CACHE_MAX", 2)
+
+    for i in range(3):
+        analyze(RESUME + b" %d" % i)
+
+    assert len(app._eval_cache) == 2
+
+
+def test_oversize_upload_is_rejected(empty_eval_cache, monkeypatch):
+    monkeypatch.setattr(app, "MAX_UPLOAD_BYTES", len(RESUME) - 1)
+
+    response = analyze(RESUME)
+
+    assert response.status_code == 413
+    assert not app._eval_cache
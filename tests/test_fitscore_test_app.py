@@ -0,0 +1,233 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import fitz
+import httpx
+import pytest
+
+import fitscore_test_app
+from fitscore_test_app import UploadSizeLimitMiddleware
+
+
+async def _downstream(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def call(path: str, content_length: bytes) -> int:
+    """Status the middleware answers for a POST carrying the given Content-Length"""
+    middleware = UploadSizeLimitMiddleware(_downstream, {"/analyze": 100})
+    scope = {"type": "http", "method": "POST", "path": path, "headers": [(b"content-length", content_length)]}
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(middleware(scope, receive, send))
+    return messages[0]["status"]
+
+
+@pytest.mark.parametrize("content_length, status", [
+    (b"100", 200),
+    (b"101", 413),
+    (b"ten", 400),
+    (b"", 400),
+])
+def test_upload_size_limit(content_length, status):
+    assert call("/analyze", content_length) == status
+
+
+def test_other_paths_are_not_checked():
+    assert call("/health", b"ten") == 200
+
+
+JOB = "Backend engineer for payments infrastructure"
+
+
+def make_pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 72), text)
+    return doc.tobytes()
+
+
+RESUMES = [
+    make_pdf("Stanford PhD, Google staff engineer. Python, Kubernetes, AWS and machine learning. " * 3),
+    make_pdf("Waterloo CS, Stripe backend engineer on Go and AWS; patents in payments routing. " * 3),
+]
+
+
+def post(path: str, files) -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=fitscore_test_app.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, data={"job_description": JOB}, files=files)
+    return asyncio.run(send())
+
+
+def analyze(pdf: bytes) -> httpx.Response:
+    return post("/analyze", {"resume": ("resume.pdf", pdf, "application/pdf")})
+
+
+def analyze_batch(*pdfs: bytes) -> httpx.Response:
+    return post("/analyze_batch", [("resumes", (f"r{i}.pdf", pdf, "application/pdf")) for i, pdf in enumerate(pdfs)])
+
+
+@pytest.fixture(autouse=True)
+def mock_engine(monkeypatch):
+    """A fresh engine in mock mode and an empty evaluation cache for every test"""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(fitscore_test_app, "_engine", None)
+    fitscore_test_app._eval_cache.clear()
+    yield
+    fitscore_test_app._eval_cache.clear()
+
+
+def test_batch_matches_single_resume_results():
+    response = analyze_batch(*RESUMES)
+
+    assert response.status_code == 200
+    evaluations = response.json()["evaluations"]
+    assert [evaluation["filename"] for evaluation in evaluations] == ["r0.pdf", "r1.pdf"]
+    for pdf, evaluation in zip(RESUMES, evaluations):
+        single = analyze(pdf).json()["fast_evaluation"]
+        assert {**evaluation["fast_evaluation"], "processing_time": 0} == {**single, "processing_time": 0}
+
+
+def test_batch_rejects_more_than_max_resumes():
+    response = analyze_batch(*[RESUMES[0]] * (fitscore_test_app.MAX_BATCH_RESUMES + 1))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"At most {fitscore_test_app.MAX_BATCH_RESUMES} resumes per batch"
+
+
+def test_repeated_upload_skips_extraction(monkeypatch):
+    first = analyze(RESUMES[0]).json()["fast_evaluation"]
+
+    async def fail(pdf_bytes):
+        raise AssertionError("extracted a cached resume")
+
+    monkeypatch.setattr(fitscore_test_app, "extract_pdf_text", fail)
+    assert analyze(RESUMES[0]).json()["fast_evaluation"] == first
+
+
+def test_oversize_pdf_is_rejected(monkeypatch):
+    monkeypatch.setattr(fitscore_test_app, "MAX_PDF_BYTES", len(RESUMES[0]) - 1)
+
+    response = analyze(RESUMES[0])
+
+    assert response.status_code == 413
+    assert not fitscore_test_app._eval_cache
+
+
+def test_pdf_pool_falls_back_to_threads(monkeypatch):
+    def no_semaphores(**kwargs):
+        raise OSError("Function not implemented")
+
+    monkeypatch.setattr(fitscore_test_app, "ProcessPoolExecutor", no_semaphores)
+    monkeypatch.setattr(fitscore_test_app, "_pdf_pool", None)
+
+    response = analyze(RESUMES[0])
+
+    assert response.status_code == 200
+    assert isinstance(fitscore_test_app._pdf_pool, ThreadPoolExecutor)
+    fitscore_test_app._pdf_pool.shutdown()
+
+
+def test_lifespan_shuts_the_pdf_pool_down(monkeypatch):
+    monkeypatch.setattr(fitscore_test_app, "_pdf_pool", None)
+
+    async def run():
+        async with fitscore_test_app.lifespan(fitscore_test_app.app):
+            return fitscore_test_app.get_pdf_pool()
+
+    pool = asyncio.run(run())
+
+    assert fitscore_test_app._pdf_pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(int)
+
+
+@pytest.mark.parametrize("value, workers", [(None, None), ("", None), ("3", 3), ("0", 1), ("four", None)])
+def test_web_concurrency_parsing(monkeypatch, value, workers):
+    if value is None:
+        monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+    else:
+        monkeypatch.setenv("WEB_CONCURRENCY", value)
+
+    assert fitscore_test_app._web_concurrency() == workers
+
+
+def test_batch_reports_rejected_resumes_per_file():
+    response = analyze_batch(RESUMES[0], b"not a pdf", make_pdf("Too short"))
+
+    assert response.status_code == 200
+    evaluations = response.json()["evaluations"]
+    assert "fast_evaluation" in evaluations[0]
+    assert evaluations[1] == {"filename": "r1.pdf", "error": "Uploaded file is not a valid PDF"}
+    assert evaluations[2] == {"filename": "r2.pdf", "error": "Could not extract meaningful text from PDF"}
+    assert response.json()["performance_metrics"]["candidates"] == 1
+
+
+def test_lifespan_restart_builds_a_fresh_engine():
+    async def run():
+        async with fitscore_test_app.lifespan(fitscore_test_app.app):
+            return await fitscore_test_app.get_engine()
+
+    first = asyncio.run(run())
+    assert fitscore_test_app._engine is None
+    assert asyncio.run(run()) is not first
+
+
+def test_pdf_with_trailing_bytes_after_eof_is_accepted():
+    response = analyze(RESUMES[0] + b"\0" * 2048)
+
+    assert response.status_code == 200
+
+
+def test_non_pdf_bytes_are_rejected():
+    response = analyze(b"GIF89a" + RESUMES[0][8:])
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Uploaded file is not a valid PDF"
+
+
+def make_long_pdf(pages: int) -> bytes:
+    doc = fitz.open()
+    for n in range(pages):
+        doc.new_page().insert_text((50, 72), f"Page {n}: Python, Kubernetes and AWS")
+    return doc.tobytes()
+
+
+def test_large_untagged_pdf_is_extracted_directly(monkeypatch):
+    def isolated(doc, number):
+        raise AssertionError("isolated a page that extracted quickly")
+
+    monkeypatch.setattr(fitscore_test_app, "_isolated_page_text", isolated)
+    pages = fitscore_test_app.ISOLATE_PAGES_ABOVE + 20
+
+    text, page_count = fitscore_test_app._extract_pymupdf(make_long_pdf(pages))
+
+    assert page_count == pages
+    assert f"Page {pages - 1}:" in text
+
+
+def test_slow_page_isolates_the_rest(monkeypatch):
+    isolated = []
+    monkeypatch.setattr(fitscore_test_app, "SLOW_PAGE_SECONDS", -1)
+    monkeypatch.setattr(fitscore_test_app, "_isolated_page_text", lambda doc, number: isolated.append(number) or "")
+    pages = fitscore_test_app.ISOLATE_PAGES_ABOVE + 20
+
+    text, _ = fitscore_test_app._extract_pymupdf(make_long_pdf(pages), 10, 20)
+
+    assert "Page 10:" in text and "Page 11:" not in text
+    assert isolated == list(range(11, 20))
+
+
+def test_cors_wraps_the_upload_size_limit():
+    # user_middleware lists the outermost layer first
+    layers = [middleware.cls for middleware in fitscore_test_app.app.user_middleware]
+
+    assert layers.index(fitscore_test_app.CORSMiddleware) < layers.index(UploadSizeLimitMiddleware)
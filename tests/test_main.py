@@ -0,0 +1,59 @@
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+RESUME = "Stanford PhD, Google staff engineer working on Python, AWS and machine learning."
+
+
+def request(method: str, path: str, **kwargs) -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.request(method, path, **kwargs)
+    return asyncio.run(send())
+
+
+@pytest.fixture(autouse=True)
+def empty_score_cache():
+    main._score_text.cache_clear()
+    yield
+    main._score_text.cache_clear()
+
+
+def test_repeated_text_is_scored_once():
+    first = main.evaluate_text(RESUME)
+    second = main.evaluate_text(RESUME)
+
+    info = main._score_text.cache_info()
+    assert (info.misses, info.hits, info.maxsize) == (1, 1, main.SCORE_CACHE_MAX)
+    first.pop("processing_time")
+    second.pop("processing_time")
+    assert first == second
+
+
+def test_text_over_the_cache_limit_is_scored_uncached():
+    text = RESUME + " filler" * (main.SCORE_CACHE_TEXT_LIMIT // 7)
+    assert len(text) > main.SCORE_CACHE_TEXT_LIMIT
+
+    result = main.evaluate_text(text)
+
+    assert main._score_text.cache_info().currsize == 0
+    assert result["overall"] == main.evaluate_text(RESUME)["overall"]
+
+
+def test_analyze_text_endpoint():
+    response = request("POST", "/analyze-text", data={"candidate_text": RESUME})
+
+    assert response.status_code == 200
+    assert response.json()["hire_decision"] == main.evaluate_text(RESUME)["hire_decision"]
+
+
+def test_home_page_is_served_after_the_api_routes():
+    page = request("GET", "/")
+    health = request("GET", "/health")
+
+    assert page.status_code == 200 and page.headers["content-type"] == "text/html; charset=utf-8"
+    assert health.json()["status"] == "healthy"
@@ -0,0 +1,151 @@
+import asyncio
+
+import fitz
+import httpx
+import pytest
+
+import main_fixed
+
+JOB = "We need a Python engineer with Kubernetes and machine learning experience, AWS and C++."
+
+
+def make_pdf(text: str) -> bytes:
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 72), text)
+    return doc.tobytes()
+
+
+RESUMES = [
+    make_pdf("Stanford PhD, Google staff engineer. Python, Kubernetes, AWS and machine learning."),
+    make_pdf("MIT graduate, Boeing mechanical design with CAD and SolidWorks, some Python scripting."),
+    make_pdf("Waterloo CS, Stripe backend engineer on Go and AWS; patents in payments routing."),
+]
+
+
+def post(path: str, data: dict, files) -> httpx.Response:
+    async def send():
+        transport = httpx.ASGITransport(app=main_fixed.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.post(path, data=data, files=files)
+    return asyncio.run(send())
+
+
+def batch(*pdfs: bytes) -> httpx.Response:
+    files = [("resume_files", (f"r{i}.pdf", pdf, "application/pdf")) for i, pdf in enumerate(pdfs)]
+    return post("/analyze-fit-batch", {"job_description": JOB}, files)
+
+
+@pytest.fixture(autouse=True)
+def empty_fit_cache():
+    main_fixed._fit_cache.clear()
+    yield
+    main_fixed._fit_cache.clear()
+
+
+def test_batch_matches_single_resume_results():
+    evaluations = batch(*RESUMES).json()["evaluations"]
+
+    main_fixed._fit_cache.clear()
+    for pdf, evaluation in zip(RESUMES, evaluations):
+        single = post("/analyze-fit", {"job_description": JOB}, {"resume_file": ("r.pdf", pdf, "application/pdf")})
+        fit, expected = evaluation["fit"], single.json()
+        fit.pop("processing_time")
+        expected.pop("processing_time")
+        assert fit == expected
+
+
+def test_batch_scans_the_job_description_once(monkeypatch):
+    scans = []
+
+    class CountingScanner:
+        def scan(self, text):
+            scans.append(text)
+            return scanner.scan(text)
+
+    scanner = main_fixed.JOB_SCANNER
+    monkeypatch.setattr(main_fixed, "JOB_SCANNER", CountingScanner())
+
+    response = batch(*RESUMES)
+
+    assert response.status_code == 200
+    assert len(response.json()["evaluations"]) == len(RESUMES)
+    assert scans == [JOB]
+
+
+def test_batch_reports_unreadable_resume_without_failing_the_rest():
+    response = batch(RESUMES[0], make_pdf("x"))
+
+    assert response.status_code == 200
+    good, bad = response.json()["evaluations"]
+    assert good["filename"] == "r0.pdf" and good["fit"]["overall_score"] > 0
+    assert bad == {"filename": "r1.pdf", "error": "Could not extract sufficient text from PDF"}
+
+
+def test_batch_rejects_more_than_max_resumes():
+    response = batch(*[RESUMES[0]] * (main_fixed.MAX_BATCH_RESUMES + 1))
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"At most {main_fixed.MAX_BATCH_RESUMES} resumes per batch"
+
+
+def analyze(pdf: bytes) -> httpx.Response:
+    return post("/analyze-fit", {"job_description": JOB}, {"resume_file": ("r.pdf", pdf, "application/pdf")})
+
+
+def test_repeated_pair_skips_extraction(monkeypatch):
+    first = analyze(RESUMES[0]).json()
+
+    def fail(pdf_bytes):
+        raise AssertionError("extracted a cached resume")
+
+    monkeypatch.setattr(main_fixed, "extract_pdf_text", fail)
+    assert analyze(RESUMES[0]).json() == first
+
+
+def test_fit_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(main_fixed, "FIT_CACHE_MAX", 2)
+    job_digest = main_fixed._digest(JOB.encode())
+
+    for pdf in RESUMES[:2]:
+        analyze(pdf)
+    analyze(RESUMES[0])  # refreshes the first resume
+    analyze(RESUMES[2])
+
+    assert list(main_fixed._fit_cache) == [
+        (main_fixed._digest(RESUMES[0]), job_digest),
+        (main_fixed._digest(RESUMES[2]), job_digest),
+    ]
+
+
+def test_oversize_pdf_is_rejected(monkeypatch):
+    monkeypatch.setattr(main_fixed, "MAX_PDF_BYTES", len(RESUMES[0]) - 1)
+
+    response = analyze(RESUMES[0])
+
+    assert response.status_code == 413
+    assert response.json()["detail"] == "PDF too large"
+
+
+def test_extracted_text_is_capped(monkeypatch):
+    monkeypatch.setattr(main_fixed, "MAX_TEXT_CHARS", 100)
+    doc = fitz.open()
+    for _ in range(3):
+        doc.new_page().insert_text((50, 72), "Python Kubernetes AWS " * 4)
+
+    assert len(main_fixed.extract_pdf_text(doc.tobytes())) <= 100
+
+
+def test_keywords_past_the_text_cap_are_ignored(monkeypatch):
+    monkeypatch.setattr(main_fixed, "MAX_TEXT_CHARS", 200)
+    doc = fitz.open()
+    page = doc.new_page()
+    for line in range(10):
+        page.insert_text((50, 72 + 14 * line), "Python backend developer on payments.")
+    doc.new_page().insert_text((50, 72), "Stanford PhD, Google staff engineer")
+
+    resume_text = main_fixed.extract_pdf_text(doc.tobytes())
+    result = main_fixed.calculate_fit_score(resume_text, JOB)
+
+    assert "Stanford" not in resume_text
+    assert result["resume_length"] == len(resume_text) <= 200
+    assert result["education_score"] < main_fixed.EDUCATION_SCORES[0]
@@ -0,0 +1,121 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from agents.fitscore.src import optimized_fitscore
+from agents.fitscore.src.optimized_fitscore import EliteTalentDetector, OptimizedFitScore
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return EliteTalentDetector()
+
+
+def test_overlapping_tiers_each_keep_their_hit(detector):
+    signals = detector.scan_signals("university of washington")
+    assert signals["edu"][1] == ["University of Washington"]
+    assert signals["edu"][4] == ["Washington"]
+
+
+def test_role_skills_overlapping_a_company_still_count(detector):
+    signals = detector.scan_signals("built ranking at scale ai", "software_engineer")
+    assert signals["company"][1] == ["Scale AI"]
+    assert signals["skills"][1] == ["AI"]
+
+
+def test_longer_skill_does_not_hide_shorter_one(detector):
+    signals = detector.scan_signals("owned the ml platform", "data_scientist")
+    assert signals["skills"] == [["ML"], [], ["ML platform"]]
+
+
+def test_detect_all_matches_separate_detectors(detector):
+    text = "scale ai staff engineer, stanford phd, python and ai, patent, 12 years of experience"
+    detections = detector.detect_all(text, "software_engineer")
+    assert detections["education"] == detector.detect_education_signals(text)
+    assert detections["experience"] == detector.detect_experience_signals(text)
+    assert detections["achievements"] == detector.detect_achievement_signals(text)
+    assert detections["skills"][0] == detector.detect_skills_match(text, "software_engineer")[0]
+    assert sorted(detections["skills"][1]) == sorted(detector.detect_skills_match(text, "software_engineer")[1])
+    assert sorted(detections["skills"][1]) == ["AI", "Python"]
+
+
+class _FakeLLM:
+    """Stands in for AsyncOpenAI, answering every chat completion with a fixed reply"""
+
+    def __init__(self, content):
+        self.chat = SimpleNamespace(completions=self)
+        self.content = content
+
+    async def create(self, **kwargs):
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=self.content))])
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(optimized_fitscore, "load_dotenv", lambda: None)
+    return OptimizedFitScore()
+
+
+# No signals at all keep confidence under 70, so it always needs verification
+BORDERLINE = "Retail cashier"
+
+
+def test_llm_verification_leaves_cached_result_alone(engine):
+    fast = engine._evaluate_sync(BORDERLINE)
+    engine.mock_mode = False
+    engine.client = _FakeLLM("1. Adjusted Overall Score: 9.9\n4. Hire decision: HIRE\n5. Confidence: 99")
+
+    verified = asyncio.run(engine.evaluate_with_llm_verification(BORDERLINE))
+
+    assert (verified.overall, verified.hire_decision, verified.confidence) == (9.9, "HIRE", 99.0)
+    assert engine._evaluate_sync(BORDERLINE) is fast
+    assert (fast.overall, fast.hire_decision) != (9.9, "HIRE")
+
+
+def test_mock_verification_leaves_cached_lists_alone(engine):
+    fast = engine._evaluate_sync(BORDERLINE)
+    concerns = list(fast.concerns)
+
+    verified = asyncio.run(engine.evaluate_with_llm_verification(BORDERLINE))
+
+    assert verified.concerns == concerns + ["Mock: Needs improvement in key areas"]
+    assert fast.concerns == concerns
+
+
+def test_batch_verification_copies_cached_and_duplicate_results(engine):
+    fast = engine._evaluate_sync(BORDERLINE)
+    engine.mock_mode = False
+    engine.client = _FakeLLM("#1: Score 9.9 | Decision HIRE | Confidence 99\n#2: Score 2.0 | Decision NO_HIRE | Confidence 90")
+
+    first, second = asyncio.run(engine.evaluate_candidates_batch([BORDERLINE, BORDERLINE]))
+
+    assert (first.overall, first.hire_decision) == (9.9, "HIRE")
+    assert (second.overall, second.hire_decision) == (2.0, "NO_HIRE")
+    assert engine._evaluate_sync(BORDERLINE) is fast
+    assert fast.overall not in (9.9, 2.0)
+
+
+
+def test_tags_are_parsed_when_lowercasing_changes_the_length(engine):
+    # "İ".lower() is two code points, so offsets in the lowercased text run ahead
+    engine.mock_mode = False
+    engine.client = _FakeLLM("\u0130\u0130\u0130\u0130 note\nScore: 8.5\nconfidence 90")
+
+    verified = asyncio.run(engine.evaluate_with_llm_verification(BORDERLINE))
+
+    assert (verified.overall, verified.confidence) == (8.5, 90.0)
+
+
+def test_cache_evicts_least_recently_used(engine):
+    engine.cache_max, engine.hot_cache_max = 2, 1
+    first, second = engine._evaluate_sync("Python engineer"), engine._evaluate_sync("Go engineer")
+
+    engine._evaluate_sync("Python engineer")  # refreshes the first entry
+    engine._evaluate_sync("Rust engineer")
+
+    assert list(engine.cache) == [("Python engineer", "software_engineer"), ("Rust engineer", "software_engineer")]
+    assert engine._evaluate_sync("Python engineer") is first
+    assert engine._evaluate_sync("Go engineer") is not second
+    assert len(engine.hot_cache) <= 1
@@ -0,0 +1,90 @@
+import re
+
+import pytest
+
+from scoring import KeywordScanner, best_score, capped_sum, fold_case, hit_sum
+
+SKILLS = r"\b(Python|Go|C\+\+|C#|Node\.js|AI|Machine Learning)\b"
+
+
+def findall(pattern: str, text: str) -> list:
+    return re.findall(pattern, text, re.IGNORECASE)
+
+
+@pytest.mark.parametrize("text", [
+    "Python, Go and C++ for AI",
+    "pythonic goals; cpython; ai-driven",
+    "C++x and C++ and C++",
+    "C#, c# and C#9",
+    "Node.js vs nodexjs vs node.jsx",
+    "machine learning\nmachine  learning",
+    "_python python_ Python1 1Python",
+    "GO, go, gO",
+])
+def test_scan_matches_findall(text):
+    assert KeywordScanner({"skills": [SKILLS]}).scan(text) == {"skills": [findall(SKILLS, text)]}
+
+
+def test_keyword_ending_in_symbol_needs_a_word_character_after_it():
+    # \b after "+" is only a boundary when a word character follows
+    scanner = KeywordScanner({"skills": [SKILLS]})
+    assert scanner.scan("C++ and C++x")["skills"] == [["C++"]]
+
+
+def test_escaped_keywords_are_matched_literally():
+    scanner = KeywordScanner({"skills": [SKILLS]})
+    assert scanner.scan("node.js, nodexjs, C++x, Cxx")["skills"] == [["node.js", "C++"]]
+
+
+def test_hits_keep_original_casing_and_text_order():
+    scanner = KeywordScanner({"skills": [SKILLS]})
+    assert scanner.scan("PYTHON then Ai then python")["skills"] == [["PYTHON", "Ai", "python"]]
+
+
+def test_keyword_in_several_groups_and_categories():
+    scanner = KeywordScanner({
+        "core": [r"\b(AI|ML)\b", r"\b(AI)\b"],
+        "extra": [r"\b(Scale AI|AI)\b"],
+    })
+    assert scanner.scan("Scale AI builds ML") == {
+        "core": [["AI", "ML"], ["AI"]],
+        "extra": [["Scale AI", "AI"]],
+    }
+
+
+def test_overlapping_keywords_of_one_group_are_each_reported():
+    # Unlike findall, which resumes after "UC Berkeley"
+    scanner = KeywordScanner({"edu": [r"\b(UC Berkeley|Berkeley)\b"]})
+    assert scanner.scan("UC Berkeley")["edu"] == [["UC Berkeley", "Berkeley"]]
+
+
+@pytest.mark.parametrize("text", [
+    "Istanbul",
+    "\u0130stanbul Python",   # lower() turns a dotted capital I into two characters
+    "\u212aubernetes",        # Kelvin sign
+    "Pyth\u017fon, \u017fql",    # long s
+    "D\u0131ANA and \u0130BM",   # dotless i
+])
+def test_fold_case_keeps_offsets(text):
+    folded = fold_case(text)
+    assert len(folded) == len(text)
+    assert folded == folded.lower()
+
+
+@pytest.mark.parametrize("pattern, text", [
+    (r"\b(Istanbul|Python)\b", "\u0130stanbul Python"),
+    (r"\b(Kubernetes)\b", "\u212aubernetes"),
+    (r"\b(Ask|Sql)\b", "a\u017fk \u017fql"),
+    (r"\b(IBM|Dina)\b", "d\u0131na \u0130BM"),
+])
+def test_scan_folds_like_ignorecase(pattern, text):
+    assert KeywordScanner({"x": [pattern]}).scan(text) == {"x": [findall(pattern, text)]}
+
+
+def test_score_helpers_skip_groups_without_hits():
+    found = [["a", "b", "c"], [], ["d"]]
+    scores = (3.0, 9.0, 2.0)
+    assert best_score(found, scores) == 3.0
+    assert best_score([[], []], scores) == 0
+    assert capped_sum(found, scores, 8) == 8 + 2.0
+    assert hit_sum(found, scores) == 9.0 + 2.0